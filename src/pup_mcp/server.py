@@ -1,10 +1,13 @@
 """MCP server entry point -- registers all tools and starts the server."""
 
+import asyncio
+import functools
 import logging
 from typing import Any, Callable, Dict
 
 from mcp.server.fastmcp import FastMCP
 
+from pup_mcp.services.datadog_client import close_client
 from pup_mcp.tools import (
     dashboards,
     downtimes,
@@ -26,8 +29,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-mcp = FastMCP("pup_mcp")
-
 # -- Annotation presets for MCP tool hints ----------------------------------
 
 _READ_ONLY: Dict[str, Any] = {
@@ -98,6 +99,7 @@ _TOOLS: list[tuple[str, str, Dict[str, Any], Callable[..., Any]]] = [
     ("pup_slos_create",         "Create SLO",          _WRITE,      slos.create_slo),
     ("pup_slos_update",         "Update SLO",          _WRITE_IDEMPOTENT, slos.update_slo),
     ("pup_slos_delete",         "Delete SLO",          _DESTRUCTIVE, slos.delete_slo),
+    ("pup_slos_bulk_delete",    "Bulk Delete SLOs",    _DESTRUCTIVE, slos.delete_slos),
     ("pup_slos_corrections",    "Get SLO Corrections", _READ_ONLY,  slos.get_slo_corrections),
     # Synthetics
     ("pup_synthetics_tests_list",     "List Synthetic Tests",     _READ_ONLY, synthetics.list_tests),
@@ -149,9 +151,37 @@ _TOOLS: list[tuple[str, str, Dict[str, Any], Callable[..., Any]]] = [
     ("pup_roles_list",          "List Roles",          _READ_ONLY,  users.list_roles),
 ]
 
-for tool_name, title, hints, handler in _TOOLS:
-    mcp.tool(name=tool_name, annotations={"title": title, **hints})(handler)
+TOOL_NAMES: frozenset[str] = frozenset(name for name, _, _, _ in _TOOLS)
+
+
+@functools.cache
+def get_mcp() -> FastMCP:
+    """Build the server and register every tool in ``_TOOLS``.
+
+    Cached, so repeated calls return the same instance.
+    """
+    server = FastMCP("pup_mcp")
+    for tool_name, title, hints, handler in _TOOLS:
+        server.tool(name=tool_name, annotations={"title": title, **hints})(handler)
+    return server
+
+
+# Module-level instance for ``mcp run src/pup_mcp/server.py``.
+mcp = get_mcp()
+
+
+async def _run_stdio() -> None:
+    """Serve over stdio, closing the shared Datadog HTTP client on exit.
+
+    The close lives here rather than in a FastMCP lifespan because the
+    lifespan is entered once per session on the SSE and HTTP transports,
+    while the client is shared by the whole process.
+    """
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await close_client()
 
 
 if __name__ == "__main__":
-    mcp.run()
+    asyncio.run(_run_stdio())
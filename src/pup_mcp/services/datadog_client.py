@@ -1,5 +1,6 @@
 """Async HTTP client for the Datadog API."""
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, Optional
@@ -13,6 +14,60 @@ logger = logging.getLogger(__name__)
 
 API_TIMEOUT = 30.0
 
+_STATUS_MESSAGES: Dict[int, str] = {
+    400: "Bad request. Check your parameters.",
+    401: "Unauthorized. Check that DD_API_KEY and DD_APP_KEY are valid.",
+    403: "Forbidden. Your API key lacks permission for this operation.",
+    404: "Resource not found. Check the ID is correct.",
+    429: "Rate limit exceeded. Wait before retrying.",
+}
+_TIMEOUT_MESSAGE = "Error: Request timed out. Try again."
+_CONNECT_MESSAGE = "Error: Could not reach Datadog API. Check DD_SITE and network."
+
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the running event loop.
+
+    Reusing one client keeps the connection pool (and its TLS sessions)
+    alive across tool calls instead of rebuilding it per request.  Pooled
+    connections belong to the loop that opened them, so a new client is
+    created whenever the running loop changes.  Call :func:`close_client`
+    before a loop exits; a client left open on a loop that has stopped
+    cannot be closed from another loop, so its connections leak.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            _discard_client(_client, _client_loop)
+        _client = httpx.AsyncClient(timeout=API_TIMEOUT)
+        _client_loop = loop
+    return _client
+
+
+def _discard_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a client left open on another loop, or log it if that loop has stopped."""
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+    logger.warning(
+        "Discarding an unclosed Datadog client from a stopped event loop; "
+        "call close_client() before the loop exits"
+    )
+
+
+async def close_client() -> None:
+    """Close the shared AsyncClient, if one was opened on the running loop."""
+    global _client, _client_loop
+    if _client is not None and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
 
 def _base_url(settings: Settings, version: str = "v1") -> str:
     return f"https://api.{settings.dd_site}/api/{version}"
@@ -64,14 +119,13 @@ async def api_request(
     url = f"{_base_url(cfg, version)}/{endpoint}"
     logger.debug("Datadog API %s %s", method, url)
 
-    async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
-        response = await client.request(
-            method,
-            url,
-            headers=_auth_headers(cfg),
-            params=params,
-            json=json_body,
-        )
+    response = await _get_client().request(
+        method,
+        url,
+        headers=_auth_headers(cfg),
+        params=params,
+        json=json_body,
+    )
 
     if response.status_code >= 400:
         raise DatadogApiError(
@@ -96,14 +150,7 @@ def handle_error(exc: Exception) -> str:
     """
     if isinstance(exc, DatadogApiError):
         status = exc.status_code
-        messages: Dict[int, str] = {
-            400: "Bad request. Check your parameters.",
-            401: "Unauthorized. Check that DD_API_KEY and DD_APP_KEY are valid.",
-            403: "Forbidden. Your API key lacks permission for this operation.",
-            404: "Resource not found. Check the ID is correct.",
-            429: "Rate limit exceeded. Wait before retrying.",
-        }
-        msg = messages.get(status, f"Datadog API returned status {status}.")
+        msg = _STATUS_MESSAGES.get(status) or f"Datadog API returned status {status}."
         body_str = ""
         if exc.body:
             try:
@@ -117,10 +164,10 @@ def handle_error(exc: Exception) -> str:
         return f"Error: {exc}"
 
     if isinstance(exc, httpx.TimeoutException):
-        return "Error: Request timed out. Try again."
+        return _TIMEOUT_MESSAGE
 
     if isinstance(exc, httpx.ConnectError):
-        return "Error: Could not reach Datadog API. Check DD_SITE and network."
+        return _CONNECT_MESSAGE
 
     logger.error("Unexpected error in tool", exc_info=exc)
     return f"Error: {type(exc).__name__}: {exc}"
@@ -1,7 +1,7 @@
-"""Datadog SLO management tools: list, get, create, update, delete, corrections."""
+"""Datadog SLO management tools: list, get, create, update, delete, bulk delete, corrections."""
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -60,6 +60,15 @@ class SloDeleteInput(BaseModel):
     slo_id: str = Field(..., min_length=1, description="SLO ID to delete")
 
 
+class SloBulkDeleteInput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+    slo_ids: List[str] = Field(..., min_length=1, description="SLO IDs to delete")
+    timeframes: List[Literal["7d", "30d", "90d", "custom"]] = Field(
+        default=["7d", "30d", "90d", "custom"], min_length=1,
+        description="Threshold timeframes to delete; an SLO with no thresholds left is removed",
+    )
+
+
 class SloCorrectionsInput(BaseModel):
     model_config = ConfigDict(extra="forbid")
     slo_id: str = Field(..., min_length=1, description="SLO ID")
@@ -70,6 +79,11 @@ class SloCorrectionsInput(BaseModel):
 # Markdown helpers
 # ---------------------------------------------------------------------------
 
+def _iso(ts: int) -> str:
+    """Format Unix epoch seconds as an ISO 8601 UTC string."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(ts))
+
+
 def _slos_md(data: Any) -> str:
     slos: List[Dict[str, Any]] = data.get("data", []) if isinstance(data, dict) else []
     if not slos:
@@ -98,9 +112,9 @@ def _corrections_md(data: Any) -> str:
         start = attrs.get("start")
         end = attrs.get("end")
         if start:
-            lines.append(f"- **Start**: {datetime.fromtimestamp(start, tz=timezone.utc).isoformat()}")
+            lines.append(f"- **Start**: {_iso(start)}")
         if end:
-            lines.append(f"- **End**: {datetime.fromtimestamp(end, tz=timezone.utc).isoformat()}")
+            lines.append(f"- **End**: {_iso(end)}")
         lines.append("")
     return "\n".join(lines)
 
@@ -204,6 +218,24 @@ async def delete_slo(params: SloDeleteInput) -> str:
         return handle_error(exc)
 
 
+async def delete_slos(params: SloBulkDeleteInput) -> str:
+    """Delete thresholds from multiple SLOs in a single request."""
+    try:
+        body = {slo_id: params.timeframes for slo_id in params.slo_ids}
+        data = await api_request("slo/bulk_delete", "v1", method="POST", json_body=body)
+        resp: Dict[str, Any] = data if isinstance(data, dict) else {}
+        result: Dict[str, Any] = resp.get("data") or {}
+        deleted = len(result.get("deleted") or [])
+        updated = len(result.get("updated") or [])
+        errors: List[Any] = resp.get("errors") or []
+        msg = f"Bulk delete complete: {deleted} SLO(s) deleted, {updated} updated."
+        if errors:
+            msg += f"\n{len(errors)} error(s):\n" + format_output(errors, ResponseFormat.JSON)
+        return msg
+    except Exception as exc:
+        return handle_error(exc)
+
+
 async def get_slo_corrections(params: SloCorrectionsInput) -> str:
     """Get status corrections for an SLO."""
     try:
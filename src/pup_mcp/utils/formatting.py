@@ -1,7 +1,7 @@
 """Response formatting and truncation utilities."""
 
 import json
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 from pup_mcp.models.common import ResponseFormat
 
@@ -25,11 +25,27 @@ def format_output(
         A string representation of the data, truncated if it exceeds
         CHARACTER_LIMIT.
     """
-    if fmt == ResponseFormat.MARKDOWN and markdown_renderer is not None:
-        return _truncate(markdown_renderer(data))
+    return _FORMATTERS[fmt](data, markdown_renderer)
+
+
+def _json_format(data: Any, markdown_renderer: Optional[Callable[[Any], str]]) -> str:
+    """Render *data* as indented JSON, ignoring any markdown renderer."""
     return _truncate(json.dumps(data, indent=2, default=str))
 
 
+def _md_format(data: Any, markdown_renderer: Optional[Callable[[Any], str]]) -> str:
+    """Render *data* with *markdown_renderer*, falling back to JSON."""
+    if markdown_renderer is None:
+        return _json_format(data, None)
+    return _truncate(markdown_renderer(data))
+
+
+_FORMATTERS: Dict[ResponseFormat, Callable[[Any, Optional[Callable[[Any], str]]], str]] = {
+    ResponseFormat.JSON: _json_format,
+    ResponseFormat.MARKDOWN: _md_format,
+}
+
+
 def _truncate(text: str) -> str:
     """Truncate text that exceeds CHARACTER_LIMIT."""
     if len(text) <= CHARACTER_LIMIT:
@@ -1,13 +1,17 @@
 """Time string parsing utilities mirroring pup CLI's relative time support."""
 
+import calendar
 import re
 import time
 from datetime import datetime
+from functools import lru_cache
 
 from pup_mcp.exceptions import TimeParseError
 
 _RELATIVE_RE = re.compile(r"^(\d+)([smhdw])$")
 _UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_UNIX_RE = re.compile(r"^\d{10,}$")
+_ISO_UTC_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z", re.ASCII)
 
 
 def parse_time(value: str) -> int:
@@ -27,17 +31,44 @@ def parse_time(value: str) -> int:
     Raises:
         TimeParseError: If the string does not match any supported format.
     """
-    # Unix timestamp (10+ digits)
-    if re.match(r"^\d{10,}$", value):
-        return int(value)
-
-    # Relative offset
+    # Relative offset -- depends on the current time, so never cached
     match = _RELATIVE_RE.match(value)
     if match:
         amount = int(match.group(1))
         unit = match.group(2)
         return int(time.time()) - amount * _UNIT_SECONDS[unit]
 
+    return _parse_absolute(value)
+
+
+@lru_cache(maxsize=512)
+def _parse_absolute(value: str) -> int:
+    """Parse an absolute Unix timestamp or ISO 8601 string.
+
+    Absolute forms always resolve to the same epoch value, so results are
+    memoized for repeated inputs.
+
+    Raises:
+        TimeParseError: If the string is not a supported absolute format.
+    """
+    # Unix timestamp (10+ digits)
+    if _UNIX_RE.match(value):
+        return int(value)
+
+    # Fast path for the common ``YYYY-MM-DDTHH:MM:SSZ`` shape
+    match = _ISO_UTC_RE.fullmatch(value)
+    if match:
+        year, month, day, hour, minute, second = map(int, match.groups())
+        if (
+            year >= 1
+            and 1 <= month <= 12
+            and 1 <= day <= calendar.monthrange(year, month)[1]
+            and hour < 24
+            and minute < 60
+            and second < 60
+        ):
+            return calendar.timegm((year, month, day, hour, minute, second, 0, 0, 0))
+
     # ISO 8601 / RFC 3339
     try:
         dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -1,12 +1,18 @@
 """Shared pytest fixtures."""
 
 import os
+from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
 import respx
 
+from pup_mcp.models.common import PaginatedInput, ResponseFormat
 from pup_mcp.models.settings import Settings
 
+API_BASE_URL = "https://api.datadoghq.com/api"
+FROZEN_NOW = 1700000000
+
 
 @pytest.fixture(autouse=True)
 def _set_env(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -27,8 +33,29 @@ def settings() -> Settings:
 
 
 @pytest.fixture()
-def mock_api() -> respx.MockRouter:
-    """Provide a respx mock router scoped to each test.
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> int:
+    """Pin ``time.time()`` as seen by the time parser to ``FROZEN_NOW``."""
+    monkeypatch.setattr("pup_mcp.utils.time_parser.time.time", lambda: float(FROZEN_NOW))
+    return FROZEN_NOW
+
+
+@pytest.fixture(scope="session")
+def _respx_router() -> respx.MockRouter:
+    """Install the respx transport patch once for the whole session.
+
+    Routes may be given as full URLs or as paths relative to
+    ``API_BASE_URL``, e.g. ``mock_api.get("/v2/rum/applications")``.
+    """
+    with respx.mock(base_url=API_BASE_URL, assert_all_called=False) as router:
+        yield router
+
+
+@pytest.fixture()
+def mock_api(_respx_router: respx.MockRouter) -> respx.MockRouter:
+    """Provide the session respx router with routes and calls cleared per test.
+
+    Routes are cleared both before and after each test, so a later test
+    that does not request ``mock_api`` cannot match a stale route.
 
     Usage::
 
@@ -38,5 +65,39 @@ def mock_api() -> respx.MockRouter:
             )
             ...
     """
-    with respx.mock(assert_all_called=False) as router:
-        yield router
+    _respx_router.clear()
+    _respx_router.reset()
+    yield _respx_router
+    _respx_router.clear()
+    _respx_router.reset()
+
+
+@pytest.fixture()
+def fake_dd(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the shared HTTP client with a stub for pure-shape tests.
+
+    Skips respx route matching entirely. ``fake_dd.request`` answers
+    ``{"data": []}`` by default; override its ``return_value`` to change
+    the status or payload::
+
+        fake_dd.request.return_value = httpx.Response(404)
+    """
+    client = Mock(spec=httpx.AsyncClient)
+    client.request = AsyncMock(return_value=httpx.Response(200, content=b'{"data": []}'))
+    monkeypatch.setattr("pup_mcp.services.datadog_client._get_client", lambda: client)
+    return client
+
+
+@pytest.fixture(scope="session")
+def default_page() -> PaginatedInput:
+    """Return one shared default PaginatedInput for list-tool tests.
+
+    Tools only read their params, so a single instance is safe to share.
+    """
+    return PaginatedInput()
+
+
+@pytest.fixture(scope="session")
+def markdown_page() -> PaginatedInput:
+    """Return one shared markdown PaginatedInput for list-tool tests."""
+    return PaginatedInput(response_format=ResponseFormat.MARKDOWN)
@@ -15,56 +15,61 @@ from pup_mcp.tools.dashboards import (
 )
 
 BASE = "https://api.datadoghq.com/api/v1"
+DASHBOARD_URL = f"{BASE}/dashboard"
+
+_DASHBOARD_LIST: dict = {
+    "dashboards": [
+        {"id": "abc-123", "title": "My Dash", "description": "Main dash", "author_handle": "user@co.com"},
+    ],
+}
+
+_DASHBOARD_ABC_123: dict = {
+    "id": "abc-123", "title": "Test Dash", "layout_type": "ordered",
+    "widgets": [{}, {}], "description": "desc", "author_handle": "me",
+    "created_at": "2024-01-01", "modified_at": "2024-01-02",
+}
 
 
 class TestListDashboards:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/dashboard").respond(
-            json={"dashboards": [{"id": "abc-123", "title": "My Dash", "author_handle": "user@co.com"}]}
-        )
-        result = await list_dashboards(PaginatedInput())
+    async def test_returns_json(
+        self, mock_api: respx.MockRouter, default_page: PaginatedInput
+    ) -> None:
+        mock_api.get(DASHBOARD_URL).respond(json=_DASHBOARD_LIST)
+        result = await list_dashboards(default_page)
         data = json.loads(result)
         assert len(data["dashboards"]) == 1
 
-    @respx.mock
-    async def test_returns_markdown(self) -> None:
-        respx.get(f"{BASE}/dashboard").respond(
-            json={"dashboards": [
-                {"id": "abc-123", "title": "My Dash", "description": "Main dash", "author_handle": "user@co.com"}
-            ]}
-        )
-        result = await list_dashboards(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_returns_markdown(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(DASHBOARD_URL).respond(json=_DASHBOARD_LIST)
+        result = await list_dashboards(markdown_page)
         assert "# Dashboards" in result
         assert "My Dash" in result
         assert "user@co.com" in result
 
-    @respx.mock
-    async def test_empty(self) -> None:
-        respx.get(f"{BASE}/dashboard").respond(json={"dashboards": []})
-        result = await list_dashboards(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_empty(self, mock_api: respx.MockRouter, markdown_page: PaginatedInput) -> None:
+        mock_api.get(DASHBOARD_URL).respond(json={"dashboards": []})
+        result = await list_dashboards(markdown_page)
         assert "No dashboards found" in result
 
+    async def test_list_payload(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(DASHBOARD_URL).respond(json=[{"id": "x"}])
+        result = await list_dashboards(markdown_page)
+        assert result == "No dashboards found."
+
 
 class TestGetDashboard:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/dashboard/abc-123").respond(
-            json={"id": "abc-123", "title": "Test", "layout_type": "ordered",
-                  "widgets": [{}], "description": "", "author_handle": "me",
-                  "created_at": "2024-01-01", "modified_at": "2024-01-02"}
-        )
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE}/dashboard/abc-123").respond(json=_DASHBOARD_ABC_123)
         result = await get_dashboard(DashboardGetInput(dashboard_id="abc-123"))
         data = json.loads(result)
         assert data["id"] == "abc-123"
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.get(f"{BASE}/dashboard/abc-123").respond(
-            json={"id": "abc-123", "title": "Test Dash", "layout_type": "ordered",
-                  "widgets": [{}, {}], "description": "desc", "author_handle": "me",
-                  "created_at": "2024-01-01", "modified_at": "2024-01-02"}
-        )
+    async def test_markdown(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE}/dashboard/abc-123").respond(json=_DASHBOARD_ABC_123)
         result = await get_dashboard(DashboardGetInput(
             dashboard_id="abc-123", response_format=ResponseFormat.MARKDOWN
         ))
@@ -73,14 +78,12 @@ class TestGetDashboard:
 
 
 class TestDeleteDashboard:
-    @respx.mock
-    async def test_success(self) -> None:
-        respx.delete(f"{BASE}/dashboard/abc-123").respond(status_code=204)
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        mock_api.delete(f"{BASE}/dashboard/abc-123").respond(status_code=204)
         result = await delete_dashboard(DashboardDeleteInput(dashboard_id="abc-123"))
         assert "deleted successfully" in result
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.delete(f"{BASE}/dashboard/nope").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.delete(f"{BASE}/dashboard/nope").respond(status_code=404)
         result = await delete_dashboard(DashboardDeleteInput(dashboard_id="nope"))
         assert "not found" in result.lower()
@@ -1,63 +1,121 @@
 """Tests for pup_mcp.services.datadog_client."""
 
+import asyncio
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
 import httpx
 import pytest
+import respx
 
 from pup_mcp.exceptions import ConfigurationError, DatadogApiError
-from pup_mcp.services.datadog_client import handle_error
+from pup_mcp.services.datadog_client import _get_client, close_client, handle_error
 
+_HANDLE_ERROR_CASES = [
+    pytest.param(
+        DatadogApiError("not found", status_code=404, body=""), ["Resource not found"], id="api_404"
+    ),
+    pytest.param(
+        DatadogApiError("unauth", status_code=401, body=""), ["Unauthorized"], id="api_401"
+    ),
+    pytest.param(
+        DatadogApiError("forbidden", status_code=403, body=""), ["Forbidden"], id="api_403"
+    ),
+    pytest.param(
+        DatadogApiError("rate limited", status_code=429, body=""), ["Rate limit"], id="api_429"
+    ),
+    pytest.param(
+        DatadogApiError("server error", status_code=500, body='{"errors": ["boom"]}'),
+        ["500", "boom"],
+        id="api_500_json_body",
+    ),
+    pytest.param(
+        DatadogApiError("server error", status_code=500, body="Internal Server Error"),
+        ["Internal Server Error"],
+        id="api_500_text_body",
+    ),
+    pytest.param(ConfigurationError("missing keys"), ["missing keys"], id="configuration_error"),
+    pytest.param(httpx.ReadTimeout("timed out"), ["timed out"], id="timeout"),
+    pytest.param(httpx.ConnectError("connection refused"), ["Could not reach"], id="connect_error"),
+    pytest.param(RuntimeError("surprise"), ["RuntimeError", "surprise"], id="unexpected_error"),
+]
 
-class TestHandleError:
-    """Test error message formatting."""
 
-    def test_datadog_api_404(self) -> None:
-        exc = DatadogApiError("not found", status_code=404, body="")
-        result = handle_error(exc)
-        assert "Resource not found" in result
+class _OkHandler(BaseHTTPRequestHandler):
+    """Answer every GET with an empty 200 over a keep-alive connection."""
 
-    def test_datadog_api_401(self) -> None:
-        exc = DatadogApiError("unauth", status_code=401, body="")
-        result = handle_error(exc)
-        assert "Unauthorized" in result
+    protocol_version = "HTTP/1.1"
 
-    def test_datadog_api_403(self) -> None:
-        exc = DatadogApiError("forbidden", status_code=403, body="")
-        result = handle_error(exc)
-        assert "Forbidden" in result
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
 
-    def test_datadog_api_429(self) -> None:
-        exc = DatadogApiError("rate limited", status_code=429, body="")
-        result = handle_error(exc)
-        assert "Rate limit" in result
+    def log_message(self, format: str, *args: object) -> None:
+        pass
 
-    def test_datadog_api_500_with_json_body(self) -> None:
-        exc = DatadogApiError("server error", status_code=500, body='{"errors": ["boom"]}')
-        result = handle_error(exc)
-        assert "500" in result
-        assert "boom" in result
 
-    def test_datadog_api_500_with_text_body(self) -> None:
-        exc = DatadogApiError("server error", status_code=500, body="Internal Server Error")
-        result = handle_error(exc)
-        assert "Internal Server Error" in result
+@pytest.fixture()
+def local_url(mock_api: respx.MockRouter) -> Iterator[str]:
+    """Serve a real HTTP endpoint on localhost and let it bypass respx."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    mock_api.route(host="127.0.0.1").pass_through()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
 
-    def test_configuration_error(self) -> None:
-        exc = ConfigurationError("missing keys")
-        result = handle_error(exc)
-        assert "missing keys" in result
 
-    def test_timeout_exception(self) -> None:
-        exc = httpx.ReadTimeout("timed out")
-        result = handle_error(exc)
-        assert "timed out" in result.lower()
+async def _fetch_status(url: str) -> int:
+    try:
+        response = await _get_client().get(url)
+        return response.status_code
+    finally:
+        await close_client()
 
-    def test_connect_error(self) -> None:
-        exc = httpx.ConnectError("connection refused")
-        result = handle_error(exc)
-        assert "Could not reach" in result
 
-    def test_unexpected_error(self) -> None:
-        exc = RuntimeError("surprise")
+async def _open_client() -> httpx.AsyncClient:
+    return _get_client()
+
+
+class TestHandleError:
+    """Test error message formatting."""
+
+    @pytest.mark.parametrize("exc, expected", _HANDLE_ERROR_CASES)
+    def test_handle_error(self, exc: Exception, expected: list[str]) -> None:
         result = handle_error(exc)
-        assert "RuntimeError" in result
-        assert "surprise" in result
+        for fragment in expected:
+            assert fragment in result
+
+
+class TestGetClient:
+    """Test shared AsyncClient reuse."""
+
+    async def test_reuses_client(self) -> None:
+        assert _get_client() is _get_client()
+
+    async def test_recreates_closed_client(self) -> None:
+        client = _get_client()
+        await client.aclose()
+        assert _get_client() is not client
+
+    async def test_close_client(self) -> None:
+        client = _get_client()
+        await close_client()
+        assert client.is_closed
+        assert _get_client() is not client
+
+    def test_requests_on_separate_loops(self, local_url: str) -> None:
+        assert asyncio.run(_fetch_status(local_url)) == 200
+        assert asyncio.run(_fetch_status(local_url)) == 200
+
+    def test_logs_client_abandoned_on_stopped_loop(
+        self, local_url: str, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        asyncio.run(_open_client())
+        with caplog.at_level(logging.WARNING):
+            assert asyncio.run(_fetch_status(local_url)) == 200
+        assert "unclosed Datadog client" in caplog.text
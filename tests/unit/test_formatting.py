@@ -5,6 +5,8 @@ import json
 from pup_mcp.models.common import ResponseFormat
 from pup_mcp.utils.formatting import CHARACTER_LIMIT, format_output
 
+_OVERSIZED = "x" * (CHARACTER_LIMIT + 1000)
+
 
 class TestFormatOutput:
     """Test format_output with JSON and Markdown modes."""
@@ -29,8 +31,7 @@ class TestFormatOutput:
         assert parsed["key"] == "value"
 
     def test_truncation(self) -> None:
-        data = "x" * (CHARACTER_LIMIT + 1000)
-        result = format_output(data, ResponseFormat.JSON)
+        result = format_output(_OVERSIZED, ResponseFormat.JSON)
         assert len(result) < CHARACTER_LIMIT + 200
         assert "[Truncated" in result
 
@@ -14,19 +14,14 @@ class TestPaginatedInput:
         assert p.offset == 0
         assert p.response_format == ResponseFormat.JSON
 
-    def test_limit_bounds(self) -> None:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"limit": 0}, {"limit": 101}, {"offset": -1}, {"bogus": "field"}],
+        ids=["limit_zero", "limit_over_max", "offset_negative", "extra_field"],
+    )
+    def test_invalid(self, kwargs: dict) -> None:
         with pytest.raises(ValidationError):
-            PaginatedInput(limit=0)
-        with pytest.raises(ValidationError):
-            PaginatedInput(limit=101)
-
-    def test_offset_non_negative(self) -> None:
-        with pytest.raises(ValidationError):
-            PaginatedInput(offset=-1)
-
-    def test_extra_fields_forbidden(self) -> None:
-        with pytest.raises(ValidationError):
-            PaginatedInput(bogus="field")
+            PaginatedInput(**kwargs)
 
 
 class TestMonitorGetInput:
@@ -34,25 +29,21 @@ class TestMonitorGetInput:
         m = MonitorGetInput(monitor_id=42)
         assert m.monitor_id == 42
 
-    def test_zero_rejected(self) -> None:
+    @pytest.mark.parametrize("monitor_id", [0, -1], ids=["zero", "negative"])
+    def test_non_positive_rejected(self, monitor_id: int) -> None:
         with pytest.raises(ValidationError):
-            MonitorGetInput(monitor_id=0)
-
-    def test_negative_rejected(self) -> None:
-        with pytest.raises(ValidationError):
-            MonitorGetInput(monitor_id=-1)
+            MonitorGetInput(monitor_id=monitor_id)
 
 
 class TestMonitorsSearchInput:
-    def test_empty_query_rejected(self) -> None:
-        with pytest.raises(ValidationError):
-            MonitorsSearchInput(query="")
-
-    def test_per_page_bounds(self) -> None:
-        with pytest.raises(ValidationError):
-            MonitorsSearchInput(query="test", per_page=0)
-        with pytest.raises(ValidationError):
-            MonitorsSearchInput(query="test", per_page=101)
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"query": ""}, {"query": "test", "per_page": 0}, {"query": "test", "per_page": 101}],
+        ids=["empty_query", "per_page_zero", "per_page_over_max"],
+    )
+    def test_invalid(self, kwargs: dict) -> None:
+        with pytest.raises(ValidationError):
+            MonitorsSearchInput(**kwargs)
 
 
 class TestMonitorsListInput:
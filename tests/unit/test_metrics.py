@@ -16,77 +16,72 @@ from pup_mcp.tools.metrics import (
 )
 
 BASE = "https://api.datadoghq.com/api/v1"
+QUERY_URL = f"{BASE}/query"
+SEARCH_URL = f"{BASE}/search"
+METRICS_URL = f"{BASE}/metrics"
+SERIES_URL = f"{BASE}/series"
 
 
 class TestQueryMetrics:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/query").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(QUERY_URL).respond(
             json={"series": [{"metric": "system.cpu.user", "pointlist": [[1, 42.0]]}]}
         )
         result = await query_metrics(MetricsQueryInput(query="avg:system.cpu.user{*}"))
         data = json.loads(result)
         assert "series" in data
 
-    @respx.mock
-    async def test_passes_params(self) -> None:
-        route = respx.get(f"{BASE}/query").respond(json={"series": []})
+    async def test_passes_params(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get(QUERY_URL).respond(json={"series": []})
         await query_metrics(MetricsQueryInput(query="avg:system.cpu.user{*}"))
         params = route.calls[0].request.url.params
         assert params["query"] == "avg:system.cpu.user{*}"
         assert "from" in params
         assert "to" in params
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.get(f"{BASE}/query").respond(status_code=400)
+    async def test_api_error(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(QUERY_URL).respond(status_code=400)
         result = await query_metrics(MetricsQueryInput(query="bad"))
         assert "Error" in result
 
 
 class TestSearchMetrics:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/search").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(SEARCH_URL).respond(
             json={"results": {"metrics": ["system.cpu.user", "system.cpu.system"]}}
         )
         result = await search_metrics(MetricsSearchInput(query="system.cpu"))
         data = json.loads(result)
         assert "results" in data
 
-    @respx.mock
-    async def test_passes_query(self) -> None:
-        route = respx.get(f"{BASE}/search").respond(json={"results": {"metrics": []}})
+    async def test_passes_query(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get(SEARCH_URL).respond(json={"results": {"metrics": []}})
         await search_metrics(MetricsSearchInput(query="disk"))
         assert route.calls[0].request.url.params["q"] == "metrics:disk"
 
 
 class TestListMetrics:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/metrics").respond(json={"metrics": ["system.cpu.user"]})
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(METRICS_URL).respond(json={"metrics": ["system.cpu.user"]})
         result = await list_metrics(MetricsListInput())
         data = json.loads(result)
         assert "metrics" in data
 
-    @respx.mock
-    async def test_with_filter(self) -> None:
-        route = respx.get(f"{BASE}/metrics").respond(json={"metrics": []})
+    async def test_with_filter(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get(METRICS_URL).respond(json={"metrics": []})
         await list_metrics(MetricsListInput(**{"filter": "env:prod"}))
-        assert "filter[tags]" in dict(route.calls[0].request.url.params)
+        assert "filter[tags]" in route.calls[0].request.url.params
 
 
 class TestSubmitMetric:
-    @respx.mock
-    async def test_success(self) -> None:
-        respx.post(f"{BASE}/series").respond(json={"status": "ok"})
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post(SERIES_URL).respond(json={"status": "ok"})
         result = await submit_metric(MetricSubmitInput(metric="custom.metric", value=42.0))
         assert "submitted successfully" in result
         assert "custom.metric" in result
 
-    @respx.mock
-    async def test_with_tags_and_host(self) -> None:
-        route = respx.post(f"{BASE}/series").respond(json={"status": "ok"})
+    async def test_with_tags_and_host(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post(SERIES_URL).respond(json={"status": "ok"})
         await submit_metric(
             MetricSubmitInput(metric="custom.metric", value=1.5, tags=["env:prod"], host="web01")
         )
@@ -94,8 +89,7 @@ class TestSubmitMetric:
         assert body["series"][0]["tags"] == ["env:prod"]
         assert body["series"][0]["host"] == "web01"
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.post(f"{BASE}/series").respond(status_code=403)
+    async def test_api_error(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post(SERIES_URL).respond(status_code=403)
         result = await submit_metric(MetricSubmitInput(metric="x", value=0))
         assert "Error" in result
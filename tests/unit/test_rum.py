@@ -1,7 +1,11 @@
 """Tests for pup_mcp.tools.rum."""
 
 import json
+from typing import Any
+from unittest.mock import Mock
 
+import httpx
+import pytest
 import respx
 
 from pup_mcp.models.common import ResponseFormat
@@ -48,7 +52,16 @@ from pup_mcp.tools.rum import (
     rum_sessions_search,
 )
 
-BASE = "https://api.datadoghq.com/api/v2"
+
+# Static inputs shared across tests; tools only read them.
+_APPS_LIST = RumAppsListInput()
+_APPS_LIST_MD = RumAppsListInput(response_format=ResponseFormat.MARKDOWN)
+_METRICS_LIST = RumMetricsListInput()
+_METRICS_LIST_MD = RumMetricsListInput(response_format=ResponseFormat.MARKDOWN)
+_SESSIONS_LIST = RumSessionsListInput()
+_SESSIONS_LIST_MD = RumSessionsListInput(response_format=ResponseFormat.MARKDOWN)
+_SESSIONS_SEARCH_VIEW = RumSessionsSearchInput(query="@type:view")
+_PLAYLISTS_LIST = RumPlaylistsListInput()
 
 
 # ---------------------------------------------------------------------------
@@ -57,52 +70,35 @@ BASE = "https://api.datadoghq.com/api/v2"
 
 
 class TestRumAppsList:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/applications").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/applications").respond(
             json={"data": [{"id": "app1", "attributes": {"name": "MyApp", "type": "browser", "created_at": "2024-01-01"}}]}
         )
-        result = await rum_apps_list(RumAppsListInput())
+        result = await rum_apps_list(_APPS_LIST)
         data = json.loads(result)
         assert len(data["data"]) == 1
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.get(f"{BASE}/rum/applications").respond(
+    async def test_markdown(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/applications").respond(
             json={"data": [{"id": "app1", "attributes": {"name": "MyApp", "type": "browser", "created_at": "2024-01-01"}}]}
         )
-        result = await rum_apps_list(RumAppsListInput(response_format=ResponseFormat.MARKDOWN))
+        result = await rum_apps_list(_APPS_LIST_MD)
         assert "# RUM Applications" in result
         assert "MyApp" in result
 
-    @respx.mock
-    async def test_empty_markdown(self) -> None:
-        respx.get(f"{BASE}/rum/applications").respond(json={"data": []})
-        result = await rum_apps_list(RumAppsListInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_empty_markdown(self, fake_dd: Mock) -> None:
+        result = await rum_apps_list(_APPS_LIST_MD)
         assert "No RUM applications found" in result
 
-
-class TestRumAppGet:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/applications/app1").respond(
-            json={"data": {"id": "app1", "attributes": {"name": "MyApp"}}}
-        )
-        result = await rum_app_get(RumAppGetInput(app_id="app1"))
-        data = json.loads(result)
-        assert data["data"]["id"] == "app1"
-
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.get(f"{BASE}/rum/applications/bad").respond(status_code=404)
-        result = await rum_app_get(RumAppGetInput(app_id="bad"))
-        assert "not found" in result.lower()
+    async def test_list_payload(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/applications").respond(json=[{"id": "x"}])
+        result = await rum_apps_list(_APPS_LIST_MD)
+        assert result == "No RUM applications found."
 
 
 class TestRumAppCreate:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.post(f"{BASE}/rum/applications").respond(
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post("/v2/rum/applications").respond(
             json={"data": {"id": "new-app", "attributes": {"name": "Web"}}}
         )
         result = await rum_app_create(RumAppCreateInput(name="Web", **{"type": "browser"}))
@@ -112,17 +108,15 @@ class TestRumAppCreate:
         assert body["data"]["attributes"]["name"] == "Web"
         assert body["data"]["attributes"]["type"] == "browser"
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.post(f"{BASE}/rum/applications").respond(status_code=400)
+    async def test_api_error(self, fake_dd: Mock) -> None:
+        fake_dd.request.return_value = httpx.Response(400)
         result = await rum_app_create(RumAppCreateInput(name="Bad", **{"type": "browser"}))
         assert "Error" in result
 
 
 class TestRumAppUpdate:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.patch(f"{BASE}/rum/applications/app1").respond(
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.patch("/v2/rum/applications/app1").respond(
             json={"data": {"id": "app1", "attributes": {"name": "Updated"}}}
         )
         result = await rum_app_update(RumAppUpdateInput(app_id="app1", name="Updated"))
@@ -131,9 +125,8 @@ class TestRumAppUpdate:
         body = json.loads(route.calls[0].request.content)
         assert body["data"]["attributes"]["name"] == "Updated"
 
-    @respx.mock
-    async def test_no_changes(self) -> None:
-        route = respx.patch(f"{BASE}/rum/applications/app1").respond(
+    async def test_no_changes(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.patch("/v2/rum/applications/app1").respond(
             json={"data": {"id": "app1"}}
         )
         await rum_app_update(RumAppUpdateInput(app_id="app1"))
@@ -141,72 +134,41 @@ class TestRumAppUpdate:
         assert body["data"]["attributes"] == {}
 
 
-class TestRumAppDelete:
-    @respx.mock
-    async def test_success(self) -> None:
-        respx.delete(f"{BASE}/rum/applications/app1").respond(status_code=204)
-        result = await rum_app_delete(RumAppDeleteInput(app_id="app1"))
-        assert "deleted successfully" in result
-
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.delete(f"{BASE}/rum/applications/bad").respond(status_code=404)
-        result = await rum_app_delete(RumAppDeleteInput(app_id="bad"))
-        assert "not found" in result.lower()
-
-
 # ---------------------------------------------------------------------------
 # Metrics
 # ---------------------------------------------------------------------------
 
 
 class TestRumMetricsList:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/metrics").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/metrics").respond(
             json={"data": [{"id": "m1", "attributes": {"path": "rum.view.count", "event_type": "views", "compute": {"aggregation_type": "count"}}}]}
         )
-        result = await rum_metrics_list(RumMetricsListInput())
+        result = await rum_metrics_list(_METRICS_LIST)
         data = json.loads(result)
         assert len(data["data"]) == 1
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.get(f"{BASE}/rum/metrics").respond(
+    async def test_markdown(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/metrics").respond(
             json={"data": [{"id": "m1", "attributes": {"path": "rum.view.count", "event_type": "views", "compute": {"aggregation_type": "count"}}}]}
         )
-        result = await rum_metrics_list(RumMetricsListInput(response_format=ResponseFormat.MARKDOWN))
+        result = await rum_metrics_list(_METRICS_LIST_MD)
         assert "# RUM Metrics" in result
         assert "rum.view.count" in result
 
-    @respx.mock
-    async def test_empty_markdown(self) -> None:
-        respx.get(f"{BASE}/rum/metrics").respond(json={"data": []})
-        result = await rum_metrics_list(RumMetricsListInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_empty_markdown(self, fake_dd: Mock) -> None:
+        result = await rum_metrics_list(_METRICS_LIST_MD)
         assert "No RUM metrics found" in result
 
-
-class TestRumMetricGet:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/metrics/m1").respond(
-            json={"data": {"id": "m1", "attributes": {"path": "rum.view.count"}}}
-        )
-        result = await rum_metric_get(RumMetricGetInput(metric_id="m1"))
-        data = json.loads(result)
-        assert data["data"]["id"] == "m1"
-
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.get(f"{BASE}/rum/metrics/bad").respond(status_code=404)
-        result = await rum_metric_get(RumMetricGetInput(metric_id="bad"))
-        assert "not found" in result.lower()
+    async def test_list_payload(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/metrics").respond(json=[{"id": "x"}])
+        result = await rum_metrics_list(_METRICS_LIST_MD)
+        assert result == "No RUM metrics found."
 
 
 class TestRumMetricCreate:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.post(f"{BASE}/rum/metrics").respond(json={"data": {"id": "new_metric"}})
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post("/v2/rum/metrics").respond(json={"data": {"id": "new_metric"}})
         result = await rum_metric_create(
             RumMetricCreateInput(name="rum.custom", event_type="views")
         )
@@ -215,9 +177,8 @@ class TestRumMetricCreate:
         assert body["data"]["id"] == "rum.custom"
         assert body["data"]["attributes"]["event_type"] == "views"
 
-    @respx.mock
-    async def test_with_filter_and_group_by(self) -> None:
-        route = respx.post(f"{BASE}/rum/metrics").respond(json={"data": {"id": "m"}})
+    async def test_with_filter_and_group_by(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post("/v2/rum/metrics").respond(json={"data": {"id": "m"}})
         await rum_metric_create(
             RumMetricCreateInput(
                 name="rum.custom", event_type="views",
@@ -230,9 +191,8 @@ class TestRumMetricCreate:
 
 
 class TestRumMetricUpdate:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.patch(f"{BASE}/rum/metrics/m1").respond(json={"data": {"id": "m1"}})
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.patch("/v2/rum/metrics/m1").respond(json={"data": {"id": "m1"}})
         result = await rum_metric_update(
             RumMetricUpdateInput(metric_id="m1", compute_type="distribution")
         )
@@ -241,29 +201,14 @@ class TestRumMetricUpdate:
         assert body["data"]["attributes"]["compute"]["aggregation_type"] == "distribution"
 
 
-class TestRumMetricDelete:
-    @respx.mock
-    async def test_success(self) -> None:
-        respx.delete(f"{BASE}/rum/metrics/m1").respond(status_code=204)
-        result = await rum_metric_delete(RumMetricDeleteInput(metric_id="m1"))
-        assert "deleted successfully" in result
-
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.delete(f"{BASE}/rum/metrics/bad").respond(status_code=404)
-        result = await rum_metric_delete(RumMetricDeleteInput(metric_id="bad"))
-        assert "not found" in result.lower()
-
-
 # ---------------------------------------------------------------------------
 # Retention Filters
 # ---------------------------------------------------------------------------
 
 
 class TestRumRetentionFiltersList:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/applications/app1/retention_filters").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/applications/app1/retention_filters").respond(
             json={"data": [{"id": "rf1", "attributes": {"name": "Keep All"}}]}
         )
         result = await rum_retention_filters_list(
@@ -273,31 +218,9 @@ class TestRumRetentionFiltersList:
         assert len(data["data"]) == 1
 
 
-class TestRumRetentionFilterGet:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/applications/app1/retention_filters/rf1").respond(
-            json={"data": {"id": "rf1", "attributes": {"name": "Keep All"}}}
-        )
-        result = await rum_retention_filter_get(
-            RumRetentionFilterGetInput(app_id="app1", filter_id="rf1")
-        )
-        data = json.loads(result)
-        assert data["data"]["id"] == "rf1"
-
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.get(f"{BASE}/rum/applications/app1/retention_filters/bad").respond(status_code=404)
-        result = await rum_retention_filter_get(
-            RumRetentionFilterGetInput(app_id="app1", filter_id="bad")
-        )
-        assert "not found" in result.lower()
-
-
 class TestRumRetentionFilterCreate:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.post(f"{BASE}/rum/applications/app1/retention_filters").respond(
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post("/v2/rum/applications/app1/retention_filters").respond(
             json={"data": {"id": "rf_new"}}
         )
         result = await rum_retention_filter_create(
@@ -310,9 +233,8 @@ class TestRumRetentionFilterCreate:
 
 
 class TestRumRetentionFilterUpdate:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.patch(f"{BASE}/rum/applications/app1/retention_filters/rf1").respond(
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.patch("/v2/rum/applications/app1/retention_filters/rf1").respond(
             json={"data": {"id": "rf1"}}
         )
         result = await rum_retention_filter_update(
@@ -322,9 +244,8 @@ class TestRumRetentionFilterUpdate:
         body = json.loads(route.calls[0].request.content)
         assert body["data"]["attributes"]["sample_rate"] == 75
 
-    @respx.mock
-    async def test_partial_update(self) -> None:
-        route = respx.patch(f"{BASE}/rum/applications/app1/retention_filters/rf1").respond(
+    async def test_partial_update(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.patch("/v2/rum/applications/app1/retention_filters/rf1").respond(
             json={"data": {"id": "rf1"}}
         )
         await rum_retention_filter_update(
@@ -335,86 +256,65 @@ class TestRumRetentionFilterUpdate:
         assert "sample_rate" not in body["data"]["attributes"]
 
 
-class TestRumRetentionFilterDelete:
-    @respx.mock
-    async def test_success(self) -> None:
-        respx.delete(f"{BASE}/rum/applications/app1/retention_filters/rf1").respond(status_code=204)
-        result = await rum_retention_filter_delete(
-            RumRetentionFilterDeleteInput(app_id="app1", filter_id="rf1")
-        )
-        assert "deleted successfully" in result
-
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.delete(f"{BASE}/rum/applications/app1/retention_filters/bad").respond(status_code=404)
-        result = await rum_retention_filter_delete(
-            RumRetentionFilterDeleteInput(app_id="app1", filter_id="bad")
-        )
-        assert "not found" in result.lower()
-
-
 # ---------------------------------------------------------------------------
 # Sessions
 # ---------------------------------------------------------------------------
 
 
 class TestRumSessionsList:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.post(f"{BASE}/rum/events/search").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post("/v2/rum/events/search").respond(
             json={"data": [{"id": "s1", "attributes": {"timestamp": "2024-01-01", "service": "web", "type": "view", "session": {"id": "sess1"}}}]}
         )
-        result = await rum_sessions_list(RumSessionsListInput())
+        result = await rum_sessions_list(_SESSIONS_LIST)
         data = json.loads(result)
         assert len(data["data"]) == 1
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.post(f"{BASE}/rum/events/search").respond(
+    async def test_markdown(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post("/v2/rum/events/search").respond(
             json={"data": [{"id": "s1", "attributes": {"timestamp": "2024-01-01", "service": "web", "type": "view", "session": {"id": "sess1"}}}]}
         )
-        result = await rum_sessions_list(RumSessionsListInput(response_format=ResponseFormat.MARKDOWN))
+        result = await rum_sessions_list(_SESSIONS_LIST_MD)
         assert "# RUM Sessions" in result
         assert "sess1" in result
 
-    @respx.mock
-    async def test_empty_markdown(self) -> None:
-        respx.post(f"{BASE}/rum/events/search").respond(json={"data": []})
-        result = await rum_sessions_list(RumSessionsListInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_empty_markdown(self, fake_dd: Mock) -> None:
+        result = await rum_sessions_list(_SESSIONS_LIST_MD)
         assert "No RUM sessions found" in result
 
-    @respx.mock
-    async def test_passes_time_and_limit(self) -> None:
-        route = respx.post(f"{BASE}/rum/events/search").respond(json={"data": []})
+    async def test_list_payload(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post("/v2/rum/events/search").respond(json=[{"id": "x"}])
+        result = await rum_sessions_list(_SESSIONS_LIST_MD)
+        assert result == "No RUM sessions found."
+
+    async def test_passes_time_and_limit(self, frozen_now: int, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post("/v2/rum/events/search").respond(json={"data": []})
         await rum_sessions_list(RumSessionsListInput(limit=50))
         body = json.loads(route.calls[0].request.content)
         assert body["page"]["limit"] == 50
-        assert "from" in body["filter"]
-        assert "to" in body["filter"]
+        assert body["filter"]["from"] == str((frozen_now - 3600) * 1000)
+        assert body["filter"]["to"] == str(frozen_now * 1000)
 
 
 class TestRumSessionsSearch:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.post(f"{BASE}/rum/events/search").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post("/v2/rum/events/search").respond(
             json={"data": [{"id": "s1"}]}
         )
-        result = await rum_sessions_search(RumSessionsSearchInput(query="@type:view"))
+        result = await rum_sessions_search(_SESSIONS_SEARCH_VIEW)
         data = json.loads(result)
         assert "data" in data
 
-    @respx.mock
-    async def test_passes_query(self) -> None:
-        route = respx.post(f"{BASE}/rum/events/search").respond(json={"data": []})
+    async def test_passes_query(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post("/v2/rum/events/search").respond(json={"data": []})
         await rum_sessions_search(RumSessionsSearchInput(query="@type:error", limit=10))
         body = json.loads(route.calls[0].request.content)
         assert body["filter"]["query"] == "@type:error"
         assert body["page"]["limit"] == 10
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.post(f"{BASE}/rum/events/search").respond(status_code=403)
-        result = await rum_sessions_search(RumSessionsSearchInput(query="@type:view"))
+    async def test_api_error(self, fake_dd: Mock) -> None:
+        fake_dd.request.return_value = httpx.Response(403)
+        result = await rum_sessions_search(_SESSIONS_SEARCH_VIEW)
         assert "Error" in result
 
 
@@ -424,59 +324,151 @@ class TestRumSessionsSearch:
 
 
 class TestRumPlaylistsList:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/playlists").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/playlists").respond(
             json={"data": [{"id": "pl1", "attributes": {"name": "My Playlist"}}]}
         )
-        result = await rum_playlists_list(RumPlaylistsListInput())
+        result = await rum_playlists_list(_PLAYLISTS_LIST)
         data = json.loads(result)
         assert len(data["data"]) == 1
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.get(f"{BASE}/rum/playlists").respond(status_code=404)
-        result = await rum_playlists_list(RumPlaylistsListInput())
+    async def test_api_error(self, fake_dd: Mock) -> None:
+        fake_dd.request.return_value = httpx.Response(404)
+        result = await rum_playlists_list(_PLAYLISTS_LIST)
         assert "not found" in result.lower()
 
 
-class TestRumPlaylistGet:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/playlists/pl1").respond(
-            json={"data": {"id": "pl1", "attributes": {"name": "My Playlist"}}}
-        )
-        result = await rum_playlist_get(RumPlaylistGetInput(playlist_id="pl1"))
-        data = json.loads(result)
-        assert data["data"]["id"] == "pl1"
-
-
 # ---------------------------------------------------------------------------
 # Heatmaps
 # ---------------------------------------------------------------------------
 
 
 class TestRumHeatmapQuery:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/rum/analytics/heatmap").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get("/v2/rum/analytics/heatmap").respond(
             json={"data": {"clicks": [{"x": 100, "y": 200, "count": 42}]}}
         )
         result = await rum_heatmap_query(RumHeatmapQueryInput(view="/home"))
         data = json.loads(result)
         assert "data" in data
 
-    @respx.mock
-    async def test_passes_params(self) -> None:
-        route = respx.get(f"{BASE}/rum/analytics/heatmap").respond(json={"data": {}})
+    async def test_passes_params(self, frozen_now: int, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get("/v2/rum/analytics/heatmap").respond(json={"data": {}})
         await rum_heatmap_query(RumHeatmapQueryInput(view="/checkout"))
         params = route.calls[0].request.url.params
         assert params["view"] == "/checkout"
-        assert "from" in params
-        assert "to" in params
+        assert params["from"] == str(frozen_now - 86400)
+        assert params["to"] == str(frozen_now)
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.get(f"{BASE}/rum/analytics/heatmap").respond(status_code=400)
+    async def test_api_error(self, fake_dd: Mock) -> None:
+        fake_dd.request.return_value = httpx.Response(400)
         result = await rum_heatmap_query(RumHeatmapQueryInput(view="/bad"))
         assert "Error" in result
+
+
+# ---------------------------------------------------------------------------
+# Get / delete by ID
+# ---------------------------------------------------------------------------
+
+_GET_CASES = [
+    pytest.param(
+        rum_app_get, RumAppGetInput(app_id="app1"), "/v2/rum/applications/app1", "app1", id="app"
+    ),
+    pytest.param(
+        rum_metric_get, RumMetricGetInput(metric_id="m1"), "/v2/rum/metrics/m1", "m1", id="metric"
+    ),
+    pytest.param(
+        rum_retention_filter_get,
+        RumRetentionFilterGetInput(app_id="app1", filter_id="rf1"),
+        "/v2/rum/applications/app1/retention_filters/rf1",
+        "rf1",
+        id="retention_filter",
+    ),
+    pytest.param(
+        rum_playlist_get,
+        RumPlaylistGetInput(playlist_id="pl1"),
+        "/v2/rum/playlists/pl1",
+        "pl1",
+        id="playlist",
+    ),
+]
+
+_GET_NOT_FOUND_CASES = [
+    pytest.param(rum_app_get, RumAppGetInput(app_id="bad"), "/v2/rum/applications/bad", id="app"),
+    pytest.param(
+        rum_metric_get, RumMetricGetInput(metric_id="bad"), "/v2/rum/metrics/bad", id="metric"
+    ),
+    pytest.param(
+        rum_retention_filter_get,
+        RumRetentionFilterGetInput(app_id="app1", filter_id="bad"),
+        "/v2/rum/applications/app1/retention_filters/bad",
+        id="retention_filter",
+    ),
+]
+
+_DELETE_CASES = [
+    pytest.param(
+        rum_app_delete, RumAppDeleteInput(app_id="app1"), "/v2/rum/applications/app1", id="app"
+    ),
+    pytest.param(
+        rum_metric_delete, RumMetricDeleteInput(metric_id="m1"), "/v2/rum/metrics/m1", id="metric"
+    ),
+    pytest.param(
+        rum_retention_filter_delete,
+        RumRetentionFilterDeleteInput(app_id="app1", filter_id="rf1"),
+        "/v2/rum/applications/app1/retention_filters/rf1",
+        id="retention_filter",
+    ),
+]
+
+_DELETE_NOT_FOUND_CASES = [
+    pytest.param(
+        rum_app_delete, RumAppDeleteInput(app_id="bad"), "/v2/rum/applications/bad", id="app"
+    ),
+    pytest.param(
+        rum_metric_delete, RumMetricDeleteInput(metric_id="bad"), "/v2/rum/metrics/bad", id="metric"
+    ),
+    pytest.param(
+        rum_retention_filter_delete,
+        RumRetentionFilterDeleteInput(app_id="app1", filter_id="bad"),
+        "/v2/rum/applications/app1/retention_filters/bad",
+        id="retention_filter",
+    ),
+]
+
+
+class TestRumGetById:
+    @pytest.mark.parametrize("tool, params, path, resource_id", _GET_CASES)
+    async def test_returns_json(
+        self, mock_api: respx.MockRouter, tool: Any, params: Any, path: str, resource_id: str
+    ) -> None:
+        mock_api.get(path).respond(json={"data": {"id": resource_id}})
+        result = await tool(params)
+        data = json.loads(result)
+        assert data["data"]["id"] == resource_id
+
+    @pytest.mark.parametrize("tool, params, path", _GET_NOT_FOUND_CASES)
+    async def test_not_found(
+        self, mock_api: respx.MockRouter, tool: Any, params: Any, path: str
+    ) -> None:
+        mock_api.get(path).respond(status_code=404)
+        result = await tool(params)
+        assert "not found" in result.lower()
+
+
+class TestRumDeleteById:
+    @pytest.mark.parametrize("tool, params, path", _DELETE_CASES)
+    async def test_success(
+        self, mock_api: respx.MockRouter, tool: Any, params: Any, path: str
+    ) -> None:
+        mock_api.delete(path).respond(status_code=204)
+        result = await tool(params)
+        assert "deleted successfully" in result
+
+    @pytest.mark.parametrize("tool, params, path", _DELETE_NOT_FOUND_CASES)
+    async def test_not_found(
+        self, mock_api: respx.MockRouter, tool: Any, params: Any, path: str
+    ) -> None:
+        mock_api.delete(path).respond(status_code=404)
+        result = await tool(params)
+        assert "not found" in result.lower()
@@ -1,5 +1,7 @@
 """Tests for pup_mcp.models.settings."""
 
+from typing import Dict
+
 import pytest
 
 from pup_mcp.models.settings import Settings
@@ -8,29 +10,33 @@ from pup_mcp.models.settings import Settings
 class TestSettings:
     """Test Settings Pydantic model."""
 
-    def test_loads_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("DD_API_KEY", "abc")
-        monkeypatch.setenv("DD_APP_KEY", "def")
+    @pytest.mark.parametrize(
+        "env, expected",
+        [
+            pytest.param(
+                {"DD_API_KEY": "abc", "DD_APP_KEY": "def"},
+                ("abc", "def", "datadoghq.com"),
+                id="default_site",
+            ),
+            pytest.param(
+                {"DD_API_KEY": "abc", "DD_APP_KEY": "def", "DD_SITE": "datadoghq.eu"},
+                ("abc", "def", "datadoghq.eu"),
+                id="custom_site",
+            ),
+        ],
+    )
+    def test_loads_from_env(
+        self, monkeypatch: pytest.MonkeyPatch, env: Dict[str, str], expected: tuple[str, str, str]
+    ) -> None:
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
         s = Settings()
-        assert s.dd_api_key == "abc"
-        assert s.dd_app_key == "def"
-        assert s.dd_site == "datadoghq.com"
+        assert (s.dd_api_key, s.dd_app_key, s.dd_site) == expected
 
-    def test_custom_site(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize("missing", ["DD_API_KEY", "DD_APP_KEY"])
+    def test_missing_key_raises(self, monkeypatch: pytest.MonkeyPatch, missing: str) -> None:
         monkeypatch.setenv("DD_API_KEY", "abc")
         monkeypatch.setenv("DD_APP_KEY", "def")
-        monkeypatch.setenv("DD_SITE", "datadoghq.eu")
-        s = Settings()
-        assert s.dd_site == "datadoghq.eu"
-
-    def test_missing_api_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.delenv("DD_API_KEY", raising=False)
-        monkeypatch.setenv("DD_APP_KEY", "def")
-        with pytest.raises(Exception):
-            Settings(_env_file=None)
-
-    def test_missing_app_key_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.setenv("DD_API_KEY", "abc")
-        monkeypatch.delenv("DD_APP_KEY", raising=False)
+        monkeypatch.delenv(missing)
         with pytest.raises(Exception):
             Settings(_env_file=None)
@@ -1,11 +1,15 @@
 """Tests for pup_mcp.tools.slos."""
 
 import json
+from typing import Any, Dict
 
+import pytest
 import respx
+from pydantic import ValidationError
 
 from pup_mcp.models.common import PaginatedInput, ResponseFormat
 from pup_mcp.tools.slos import (
+    SloBulkDeleteInput,
     SloCorrectionsInput,
     SloCreateInput,
     SloDeleteInput,
@@ -13,6 +17,7 @@ from pup_mcp.tools.slos import (
     SloUpdateInput,
     create_slo,
     delete_slo,
+    delete_slos,
     get_slo,
     get_slo_corrections,
     list_slos,
@@ -20,129 +25,166 @@ from pup_mcp.tools.slos import (
 )
 
 BASE = "https://api.datadoghq.com/api/v1"
+SLO_URL = f"{BASE}/slo"
+SLO1_URL = f"{BASE}/slo/slo1"
+SLO1_CORRECTIONS_URL = f"{BASE}/slo/slo1/corrections"
+BULK_DELETE_URL = f"{BASE}/slo/bulk_delete"
+
+_SLO_LIST: dict = {
+    "data": [
+        {"id": "slo1", "name": "Uptime", "type": "metric",
+         "description": "99.9% uptime", "thresholds": [{"target": 99.9, "timeframe": "30d"}]},
+    ],
+}
+
+_CORRECTIONS: dict = {
+    "data": [
+        {"id": "corr1", "attributes": {
+            "category": "scheduled_maintenance",
+            "description": "Planned downtime",
+            "start": 1700000000, "end": 1700003600,
+        }},
+    ],
+}
 
 
 class TestListSlos:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/slo").respond(
-            json={"data": [{"id": "slo1", "name": "Uptime", "type": "metric",
-                            "description": "99.9% uptime", "thresholds": [{"target": 99.9, "timeframe": "30d"}]}]}
-        )
-        result = await list_slos(PaginatedInput())
+    async def test_returns_json(
+        self, mock_api: respx.MockRouter, default_page: PaginatedInput
+    ) -> None:
+        mock_api.get(SLO_URL).respond(json=_SLO_LIST)
+        result = await list_slos(default_page)
         data = json.loads(result)
         assert len(data["data"]) == 1
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.get(f"{BASE}/slo").respond(
-            json={"data": [{"id": "slo1", "name": "Uptime", "type": "metric",
-                            "description": "99.9% uptime", "thresholds": [{"target": 99.9, "timeframe": "30d"}]}]}
-        )
-        result = await list_slos(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_markdown(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(SLO_URL).respond(json=_SLO_LIST)
+        result = await list_slos(markdown_page)
         assert "# SLOs" in result
         assert "99.9%" in result
 
-    @respx.mock
-    async def test_empty(self) -> None:
-        respx.get(f"{BASE}/slo").respond(json={"data": []})
-        result = await list_slos(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_empty(self, mock_api: respx.MockRouter, markdown_page: PaginatedInput) -> None:
+        mock_api.get(SLO_URL).respond(json={"data": []})
+        result = await list_slos(markdown_page)
         assert "No SLOs found" in result
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.get(f"{BASE}/slo").respond(status_code=403)
-        result = await list_slos(PaginatedInput())
+    async def test_list_payload(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(SLO_URL).respond(json=[{"id": "x"}])
+        result = await list_slos(markdown_page)
+        assert result == "No SLOs found."
+
+    async def test_api_error(
+        self, mock_api: respx.MockRouter, default_page: PaginatedInput
+    ) -> None:
+        mock_api.get(SLO_URL).respond(status_code=403)
+        result = await list_slos(default_page)
         assert "Error" in result
 
 
 class TestGetSlo:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/slo/slo1").respond(json={"data": {"id": "slo1", "name": "Uptime"}})
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(SLO1_URL).respond(json={"data": {"id": "slo1", "name": "Uptime"}})
         result = await get_slo(SloGetInput(slo_id="slo1"))
         data = json.loads(result)
         assert data["data"]["id"] == "slo1"
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.get(f"{BASE}/slo/bad").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE}/slo/bad").respond(status_code=404)
         result = await get_slo(SloGetInput(slo_id="bad"))
         assert "not found" in result.lower()
 
 
-class TestCreateSlo:
-    @respx.mock
-    async def test_metric_slo(self) -> None:
-        route = respx.post(f"{BASE}/slo").respond(
-            json={"data": [{"id": "new-slo", "name": "API Availability"}]}
-        )
-        result = await create_slo(SloCreateInput(
-            name="API Availability",
-            slo_type="metric",
-            thresholds=[{"target": 99.9, "timeframe": "30d"}],
-            query={"numerator": "sum:requests{status:2xx}", "denominator": "sum:requests"},
-        ))
-        assert "created successfully" in result
-        assert "new-slo" in result
-        body = json.loads(route.calls[0].request.content)
-        assert body["name"] == "API Availability"
-        assert body["type"] == "metric"
-        assert body["thresholds"][0]["target"] == 99.9
-        assert body["query"]["numerator"] == "sum:requests{status:2xx}"
+_METRIC_SLO = SloCreateInput(
+    name="API Availability",
+    slo_type="metric",
+    thresholds=[{"target": 99.9, "timeframe": "30d"}],
+    query={"numerator": "sum:requests{status:2xx}", "denominator": "sum:requests"},
+)
 
-    @respx.mock
-    async def test_monitor_slo(self) -> None:
-        route = respx.post(f"{BASE}/slo").respond(
-            json={"data": [{"id": "mon-slo", "name": "Monitor Uptime"}]}
-        )
-        result = await create_slo(SloCreateInput(
+_CREATE_BODY_CASES = [
+    pytest.param(
+        _METRIC_SLO,
+        {
+            "name": "API Availability",
+            "type": "metric",
+            "thresholds": [{"target": 99.9, "timeframe": "30d"}],
+            "query": {"numerator": "sum:requests{status:2xx}", "denominator": "sum:requests"},
+        },
+        id="metric",
+    ),
+    pytest.param(
+        SloCreateInput(
             name="Monitor Uptime",
             slo_type="monitor",
             thresholds=[{"target": 99.5, "timeframe": "7d"}],
             monitor_ids=[123, 456],
-        ))
-        assert "created successfully" in result
-        body = json.loads(route.calls[0].request.content)
-        assert body["type"] == "monitor"
-        assert body["monitor_ids"] == [123, 456]
-
-    @respx.mock
-    async def test_with_optional_fields(self) -> None:
-        route = respx.post(f"{BASE}/slo").respond(
-            json={"data": [{"id": "s1", "name": "Test"}]}
-        )
-        await create_slo(SloCreateInput(
+        ),
+        {
+            "name": "Monitor Uptime",
+            "type": "monitor",
+            "thresholds": [{"target": 99.5, "timeframe": "7d"}],
+            "monitor_ids": [123, 456],
+        },
+        id="monitor",
+    ),
+    pytest.param(
+        SloCreateInput(
             name="Test",
             slo_type="metric",
             thresholds=[{"target": 99.0, "timeframe": "30d"}],
             description="My test SLO",
             tags=["team:backend", "env:prod"],
             query={"numerator": "sum:ok{*}", "denominator": "sum:total{*}"},
-        ))
-        body = json.loads(route.calls[0].request.content)
-        assert body["description"] == "My test SLO"
-        assert body["tags"] == ["team:backend", "env:prod"]
-
-    @respx.mock
-    async def test_without_optional_fields(self) -> None:
-        route = respx.post(f"{BASE}/slo").respond(
-            json={"data": [{"id": "s1"}]}
-        )
-        await create_slo(SloCreateInput(
+        ),
+        {
+            "name": "Test",
+            "type": "metric",
+            "thresholds": [{"target": 99.0, "timeframe": "30d"}],
+            "description": "My test SLO",
+            "tags": ["team:backend", "env:prod"],
+            "query": {"numerator": "sum:ok{*}", "denominator": "sum:total{*}"},
+        },
+        id="with_optional_fields",
+    ),
+    pytest.param(
+        SloCreateInput(
             name="Minimal",
             slo_type="metric",
             thresholds=[{"target": 99.0, "timeframe": "30d"}],
-        ))
-        body = json.loads(route.calls[0].request.content)
-        assert "description" not in body
-        assert "tags" not in body
-        assert "monitor_ids" not in body
-        assert "query" not in body
-
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.post(f"{BASE}/slo").respond(status_code=400)
+        ),
+        {
+            "name": "Minimal",
+            "type": "metric",
+            "thresholds": [{"target": 99.0, "timeframe": "30d"}],
+        },
+        id="without_optional_fields",
+    ),
+]
+
+
+class TestCreateSlo:
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post(SLO_URL).respond(
+            json={"data": [{"id": "new-slo", "name": "API Availability"}]}
+        )
+        result = await create_slo(_METRIC_SLO)
+        assert "created successfully" in result
+        assert "new-slo" in result
+
+    @pytest.mark.parametrize("params, expected", _CREATE_BODY_CASES)
+    async def test_request_body(
+        self, mock_api: respx.MockRouter, params: SloCreateInput, expected: Dict[str, Any]
+    ) -> None:
+        route = mock_api.post(SLO_URL).respond(json={"data": [{"id": "s1"}]})
+        await create_slo(params)
+        assert json.loads(route.calls[0].request.content) == expected
+
+    async def test_api_error(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post(SLO_URL).respond(status_code=400)
         result = await create_slo(SloCreateInput(
             name="Bad", slo_type="metric",
             thresholds=[{"target": 99.0, "timeframe": "30d"}],
@@ -151,9 +193,8 @@ class TestCreateSlo:
 
 
 class TestUpdateSlo:
-    @respx.mock
-    async def test_update_name_and_description(self) -> None:
-        route = respx.put(f"{BASE}/slo/slo1").respond(
+    async def test_update_name_and_description(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.put(SLO1_URL).respond(
             json={"data": [{"id": "slo1", "name": "Updated"}]}
         )
         result = await update_slo(SloUpdateInput(
@@ -169,9 +210,8 @@ class TestUpdateSlo:
         assert body["description"] == "Updated desc"
         assert body["type"] == "metric"
 
-    @respx.mock
-    async def test_update_thresholds(self) -> None:
-        route = respx.put(f"{BASE}/slo/slo1").respond(
+    async def test_update_thresholds(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.put(SLO1_URL).respond(
             json={"data": [{"id": "slo1"}]}
         )
         await update_slo(SloUpdateInput(
@@ -184,9 +224,8 @@ class TestUpdateSlo:
         assert body["thresholds"][0]["target"] == 99.99
         assert body["thresholds"][0]["warning"] == 99.95
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.put(f"{BASE}/slo/bad").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.put(f"{BASE}/slo/bad").respond(status_code=404)
         result = await update_slo(SloUpdateInput(
             slo_id="bad", name="X", slo_type="metric",
             thresholds=[{"target": 99.0, "timeframe": "30d"}],
@@ -195,59 +234,80 @@ class TestUpdateSlo:
 
 
 class TestGetSloCorrections:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/slo/slo1/corrections").respond(
-            json={"data": [{"id": "corr1", "attributes": {
-                "category": "scheduled_maintenance",
-                "description": "Planned downtime",
-                "start": 1700000000, "end": 1700003600,
-            }}]}
-        )
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(SLO1_CORRECTIONS_URL).respond(json=_CORRECTIONS)
         result = await get_slo_corrections(SloCorrectionsInput(slo_id="slo1"))
         data = json.loads(result)
         assert len(data["data"]) == 1
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.get(f"{BASE}/slo/slo1/corrections").respond(
-            json={"data": [{"id": "corr1", "attributes": {
-                "category": "scheduled_maintenance",
-                "description": "Planned downtime",
-                "start": 1700000000, "end": 1700003600,
-            }}]}
-        )
+    async def test_markdown(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(SLO1_CORRECTIONS_URL).respond(json=_CORRECTIONS)
         result = await get_slo_corrections(
             SloCorrectionsInput(slo_id="slo1", response_format=ResponseFormat.MARKDOWN)
         )
         assert "# SLO Corrections" in result
         assert "Planned downtime" in result
         assert "scheduled_maintenance" in result
+        assert "- **Start**: 2023-11-14T22:13:20+00:00" in result
+        assert "- **End**: 2023-11-14T23:13:20+00:00" in result
 
-    @respx.mock
-    async def test_empty_markdown(self) -> None:
-        respx.get(f"{BASE}/slo/slo1/corrections").respond(json={"data": []})
+    async def test_empty_markdown(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(SLO1_CORRECTIONS_URL).respond(json={"data": []})
         result = await get_slo_corrections(
             SloCorrectionsInput(slo_id="slo1", response_format=ResponseFormat.MARKDOWN)
         )
         assert "No corrections found" in result
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.get(f"{BASE}/slo/bad/corrections").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE}/slo/bad/corrections").respond(status_code=404)
         result = await get_slo_corrections(SloCorrectionsInput(slo_id="bad"))
         assert "not found" in result.lower()
 
 
 class TestDeleteSlo:
-    @respx.mock
-    async def test_success(self) -> None:
-        respx.delete(f"{BASE}/slo/slo1").respond(status_code=204)
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        mock_api.delete(SLO1_URL).respond(status_code=204)
         result = await delete_slo(SloDeleteInput(slo_id="slo1"))
         assert "deleted successfully" in result
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.delete(f"{BASE}/slo/bad").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.delete(f"{BASE}/slo/bad").respond(status_code=404)
         result = await delete_slo(SloDeleteInput(slo_id="bad"))
         assert "not found" in result.lower()
+
+
+class TestDeleteSlos:
+    async def test_single_request_for_all_ids(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post(BULK_DELETE_URL).respond(
+            json={"data": {"deleted": ["slo1", "slo2"], "updated": []}}
+        )
+        result = await delete_slos(SloBulkDeleteInput(slo_ids=["slo1", "slo2"]))
+        assert "2 SLO(s) deleted" in result
+        assert route.call_count == 1
+        body = json.loads(route.calls[0].request.content)
+        all_timeframes = ["7d", "30d", "90d", "custom"]
+        assert body == {"slo1": all_timeframes, "slo2": all_timeframes}
+
+    def test_rejects_unknown_timeframe(self) -> None:
+        with pytest.raises(ValidationError):
+            SloBulkDeleteInput(slo_ids=["slo1"], timeframes=["30days"])
+
+    async def test_custom_timeframes_and_errors(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post(BULK_DELETE_URL).respond(
+            json={
+                "data": {"deleted": [], "updated": ["slo1"]},
+                "errors": [{"id": "bad", "message": "SLO not found"}],
+            }
+        )
+        result = await delete_slos(
+            SloBulkDeleteInput(slo_ids=["slo1", "bad"], timeframes=["7d"])
+        )
+        assert "1 updated" in result
+        assert "SLO not found" in result
+        body = json.loads(route.calls[0].request.content)
+        assert body["slo1"] == ["7d"]
+
+    async def test_api_error(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post(BULK_DELETE_URL).respond(status_code=403)
+        result = await delete_slos(SloBulkDeleteInput(slo_ids=["slo1"]))
+        assert "Error" in result
@@ -1,10 +1,12 @@
 """Tests for pup_mcp.tools.synthetics."""
 
 import json
+from typing import Any, Dict, Optional
 
+import pytest
 import respx
 
-from pup_mcp.models.common import PaginatedInput, ResponseFormat
+from pup_mcp.models.common import PaginatedInput
 from pup_mcp.tools.synthetics import (
     SyntheticsCreateApiTestInput,
     SyntheticsDeleteTestInput,
@@ -21,76 +23,84 @@ from pup_mcp.tools.synthetics import (
 )
 
 BASE = "https://api.datadoghq.com/api/v1"
+TESTS_URL = f"{BASE}/synthetics/tests"
+SEARCH_URL = f"{BASE}/synthetics/tests/search"
+API_TEST_URL = f"{BASE}/synthetics/tests/api"
+DELETE_URL = f"{BASE}/synthetics/tests/delete"
+
+_TEST_LIST: dict = {
+    "tests": [{"public_id": "abc-123", "name": "Homepage", "type": "api", "status": "live"}],
+}
 
 
 class TestListTests:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/synthetics/tests").respond(
-            json={"tests": [{"public_id": "abc-123", "name": "Homepage", "type": "api", "status": "live"}]}
-        )
-        result = await list_tests(PaginatedInput())
+    async def test_returns_json(
+        self, mock_api: respx.MockRouter, default_page: PaginatedInput
+    ) -> None:
+        mock_api.get(TESTS_URL).respond(json=_TEST_LIST)
+        result = await list_tests(default_page)
         data = json.loads(result)
         assert len(data["tests"]) == 1
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.get(f"{BASE}/synthetics/tests").respond(
-            json={"tests": [{"public_id": "abc-123", "name": "Homepage", "type": "api", "status": "live"}]}
-        )
-        result = await list_tests(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_markdown(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(TESTS_URL).respond(json=_TEST_LIST)
+        result = await list_tests(markdown_page)
         assert "# Synthetic Tests" in result
         assert "Homepage" in result
 
-    @respx.mock
-    async def test_empty_markdown(self) -> None:
-        respx.get(f"{BASE}/synthetics/tests").respond(json={"tests": []})
-        result = await list_tests(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
+    async def test_empty_markdown(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(TESTS_URL).respond(json={"tests": []})
+        result = await list_tests(markdown_page)
         assert "No synthetic tests found" in result
 
+    async def test_list_payload(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(TESTS_URL).respond(json=[{"id": "x"}])
+        result = await list_tests(markdown_page)
+        assert result == "No synthetic tests found."
+
 
 class TestGetTest:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/synthetics/tests/abc-123").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE}/synthetics/tests/abc-123").respond(
             json={"public_id": "abc-123", "name": "Homepage"}
         )
         result = await get_test(SyntheticsTestGetInput(test_id="abc-123"))
         data = json.loads(result)
         assert data["public_id"] == "abc-123"
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.get(f"{BASE}/synthetics/tests/bad").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE}/synthetics/tests/bad").respond(status_code=404)
         result = await get_test(SyntheticsTestGetInput(test_id="bad"))
         assert "not found" in result.lower()
 
 
 class TestSearchTests:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/synthetics/tests/search").respond(json={"tests": []})
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(SEARCH_URL).respond(json={"tests": []})
         result = await search_tests(SyntheticsSearchInput())
         data = json.loads(result)
         assert "tests" in data
 
-    @respx.mock
-    async def test_with_text(self) -> None:
-        route = respx.get(f"{BASE}/synthetics/tests/search").respond(json={"tests": []})
+    async def test_with_text(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get(SEARCH_URL).respond(json={"tests": []})
         await search_tests(SyntheticsSearchInput(text="homepage"))
         assert route.calls[0].request.url.params["text"] == "homepage"
 
-    @respx.mock
-    async def test_without_text(self) -> None:
-        route = respx.get(f"{BASE}/synthetics/tests/search").respond(json={"tests": []})
+    async def test_without_text(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.get(SEARCH_URL).respond(json={"tests": []})
         await search_tests(SyntheticsSearchInput())
-        assert "text" not in dict(route.calls[0].request.url.params)
+        assert "text" not in route.calls[0].request.url.params
 
 
 class TestListLocations:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/synthetics/locations").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE}/synthetics/locations").respond(
             json={"locations": [{"id": "aws:us-east-1", "name": "US East"}]}
         )
         result = await list_locations()
@@ -109,11 +119,16 @@ _MINIMAL_CONFIG: dict = {
     "request": {"method": "GET", "url": "https://example.com"},
 }
 
+_MINIMAL_CREATE = SyntheticsCreateApiTestInput(
+    name="Minimal",
+    config=_MINIMAL_CONFIG,
+    locations=["aws:us-east-1"],
+)
+
 
 class TestCreateApiTest:
-    @respx.mock
-    async def test_creates_http_test(self) -> None:
-        route = respx.post(f"{BASE}/synthetics/tests/api").respond(
+    async def test_creates_http_test(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post(API_TEST_URL).respond(
             json={
                 "public_id": "abc-def-ghi",
                 "name": "My HTTP Test",
@@ -138,15 +153,14 @@ class TestCreateApiTest:
         assert body["config"] == _MINIMAL_CONFIG
         assert body["locations"] == ["aws:us-east-1"]
 
-    @respx.mock
-    async def test_creates_ssl_test(self) -> None:
+    async def test_creates_ssl_test(self, mock_api: respx.MockRouter) -> None:
         ssl_config: dict = {
             "assertions": [
                 {"operator": "isInMoreThan", "target": 30, "type": "certificate"},
             ],
             "request": {"host": "example.com", "port": 443},
         }
-        route = respx.post(f"{BASE}/synthetics/tests/api").respond(
+        route = mock_api.post(API_TEST_URL).respond(
             json={"public_id": "ssl-123", "name": "SSL Check", "type": "api", "subtype": "ssl"}
         )
         result = await create_api_test(
@@ -161,9 +175,8 @@ class TestCreateApiTest:
         body = json.loads(route.calls[0].request.content)
         assert body["subtype"] == "ssl"
 
-    @respx.mock
-    async def test_with_all_optional_fields(self) -> None:
-        route = respx.post(f"{BASE}/synthetics/tests/api").respond(
+    async def test_with_all_optional_fields(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post(API_TEST_URL).respond(
             json={"public_id": "full-123", "name": "Full Test"}
         )
         result = await create_api_test(
@@ -194,18 +207,11 @@ class TestCreateApiTest:
         assert body["options"]["retry"]["count"] == 3
         assert body["locations"] == ["aws:us-east-1", "aws:eu-west-1"]
 
-    @respx.mock
-    async def test_without_optional_fields(self) -> None:
-        route = respx.post(f"{BASE}/synthetics/tests/api").respond(
+    async def test_without_optional_fields(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post(API_TEST_URL).respond(
             json={"public_id": "min-123"}
         )
-        await create_api_test(
-            SyntheticsCreateApiTestInput(
-                name="Minimal",
-                config=_MINIMAL_CONFIG,
-                locations=["aws:us-east-1"],
-            )
-        )
+        await create_api_test(_MINIMAL_CREATE)
         body = json.loads(route.calls[0].request.content)
         assert "message" not in body
         assert "tags" not in body
@@ -214,20 +220,12 @@ class TestCreateApiTest:
         # subtype defaults to "http"
         assert body["subtype"] == "http"
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.post(f"{BASE}/synthetics/tests/api").respond(status_code=400)
-        result = await create_api_test(
-            SyntheticsCreateApiTestInput(
-                name="Bad",
-                config=_MINIMAL_CONFIG,
-                locations=["aws:us-east-1"],
-            )
-        )
+    async def test_api_error(self, mock_api: respx.MockRouter) -> None:
+        mock_api.post(API_TEST_URL).respond(status_code=400)
+        result = await create_api_test(_MINIMAL_CREATE)
         assert "Error" in result
 
-    @respx.mock
-    async def test_config_with_multiple_assertions(self) -> None:
+    async def test_config_with_multiple_assertions(self, mock_api: respx.MockRouter) -> None:
         multi_config: dict = {
             "assertions": [
                 {"operator": "is", "target": 200, "type": "statusCode"},
@@ -241,7 +239,7 @@ class TestCreateApiTest:
                 "body": '{"check": true}',
             },
         }
-        route = respx.post(f"{BASE}/synthetics/tests/api").respond(
+        route = mock_api.post(API_TEST_URL).respond(
             json={"public_id": "multi-123"}
         )
         await create_api_test(
@@ -262,73 +260,93 @@ class TestCreateApiTest:
 # ---------------------------------------------------------------------------
 
 
+_UPDATE_INPUT = SyntheticsUpdateApiTestInput(
+    test_id="abc-123",
+    name="Updated Test",
+    subtype="http",
+    config=_MINIMAL_CONFIG,
+    locations=["aws:us-east-1"],
+)
+
+_UPDATE_BODY_CASES = [
+    pytest.param(
+        _UPDATE_INPUT,
+        {
+            "name": "Updated Test",
+            "type": "api",
+            "subtype": "http",
+            "config": _MINIMAL_CONFIG,
+            "locations": ["aws:us-east-1"],
+        },
+        id="required_fields",
+    ),
+    pytest.param(
+        SyntheticsUpdateApiTestInput(
+            test_id="abc-123",
+            name="Opt Test",
+            config=_MINIMAL_CONFIG,
+            locations=["aws:us-west-2"],
+            options={"tick_every": 300, "follow_redirects": False},
+            message="Updated alert",
+            tags=["env:prod"],
+            status="paused",
+        ),
+        {
+            "name": "Opt Test",
+            "type": "api",
+            "subtype": "http",
+            "config": _MINIMAL_CONFIG,
+            "locations": ["aws:us-west-2"],
+            "options": {"tick_every": 300, "follow_redirects": False},
+            "message": "Updated alert",
+            "tags": ["env:prod"],
+            "status": "paused",
+        },
+        id="with_options",
+    ),
+    pytest.param(
+        SyntheticsUpdateApiTestInput(
+            test_id="abc-123",
+            name="Minimal Update",
+            config=_MINIMAL_CONFIG,
+            locations=["aws:us-east-1"],
+        ),
+        {
+            "name": "Minimal Update",
+            "type": "api",
+            "subtype": "http",
+            "config": _MINIMAL_CONFIG,
+            "locations": ["aws:us-east-1"],
+        },
+        id="without_optional_fields",
+    ),
+]
+
+
 class TestUpdateApiTest:
-    @respx.mock
-    async def test_updates_test(self) -> None:
-        route = respx.put(f"{BASE}/synthetics/tests/api/abc-123").respond(
+    async def test_updates_test(self, mock_api: respx.MockRouter) -> None:
+        mock_api.put(f"{BASE}/synthetics/tests/api/abc-123").respond(
             json={"public_id": "abc-123", "name": "Updated Test"}
         )
-        result = await update_api_test(
-            SyntheticsUpdateApiTestInput(
-                test_id="abc-123",
-                name="Updated Test",
-                subtype="http",
-                config=_MINIMAL_CONFIG,
-                locations=["aws:us-east-1"],
-            )
-        )
+        result = await update_api_test(_UPDATE_INPUT)
         assert "updated successfully" in result
         assert "abc-123" in result
-        body = json.loads(route.calls[0].request.content)
-        assert body["name"] == "Updated Test"
-        assert body["type"] == "api"
-        assert body["subtype"] == "http"
 
-    @respx.mock
-    async def test_update_with_options(self) -> None:
-        route = respx.put(f"{BASE}/synthetics/tests/api/xyz-789").respond(
-            json={"public_id": "xyz-789", "name": "Opt Test"}
-        )
-        await update_api_test(
-            SyntheticsUpdateApiTestInput(
-                test_id="xyz-789",
-                name="Opt Test",
-                config=_MINIMAL_CONFIG,
-                locations=["aws:us-west-2"],
-                options={"tick_every": 300, "follow_redirects": False},
-                message="Updated alert",
-                tags=["env:prod"],
-                status="paused",
-            )
-        )
-        body = json.loads(route.calls[0].request.content)
-        assert body["options"]["tick_every"] == 300
-        assert body["message"] == "Updated alert"
-        assert body["tags"] == ["env:prod"]
-        assert body["status"] == "paused"
-
-    @respx.mock
-    async def test_update_without_optional_fields(self) -> None:
-        route = respx.put(f"{BASE}/synthetics/tests/api/abc-123").respond(
+    @pytest.mark.parametrize("params, expected", _UPDATE_BODY_CASES)
+    async def test_request_body(
+        self,
+        mock_api: respx.MockRouter,
+        params: SyntheticsUpdateApiTestInput,
+        expected: Dict[str, Any],
+    ) -> None:
+        route = mock_api.put(f"{BASE}/synthetics/tests/api/abc-123").respond(
             json={"public_id": "abc-123"}
         )
-        await update_api_test(
-            SyntheticsUpdateApiTestInput(
-                test_id="abc-123",
-                name="Minimal Update",
-                config=_MINIMAL_CONFIG,
-                locations=["aws:us-east-1"],
-            )
-        )
-        body = json.loads(route.calls[0].request.content)
-        assert "message" not in body
-        assert "tags" not in body
-        assert "status" not in body
-        assert "options" not in body
+        await update_api_test(params)
+        assert json.loads(route.calls[0].request.content) == expected
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.put(f"{BASE}/synthetics/tests/api/bad").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.put(f"{BASE}/synthetics/tests/api/bad").respond(status_code=404)
         result = await update_api_test(
             SyntheticsUpdateApiTestInput(
                 test_id="bad",
@@ -339,9 +357,8 @@ class TestUpdateApiTest:
         )
         assert "not found" in result.lower()
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.put(f"{BASE}/synthetics/tests/api/abc-123").respond(status_code=400)
+    async def test_api_error(self, mock_api: respx.MockRouter) -> None:
+        mock_api.put(f"{BASE}/synthetics/tests/api/abc-123").respond(status_code=400)
         result = await update_api_test(
             SyntheticsUpdateApiTestInput(
                 test_id="abc-123",
@@ -358,43 +375,38 @@ class TestUpdateApiTest:
 # ---------------------------------------------------------------------------
 
 
-class TestDeleteTest:
-    @respx.mock
-    async def test_delete_single(self) -> None:
-        route = respx.post(f"{BASE}/synthetics/tests/delete").respond(
-            json={"deleted_tests": [{"public_id": "abc-123", "deleted_at": "2024-01-01T00:00:00Z"}]}
-        )
-        result = await delete_test(SyntheticsDeleteTestInput(public_ids=["abc-123"]))
-        assert "deleted successfully" in result
-        body = json.loads(route.calls[0].request.content)
-        assert body["public_ids"] == ["abc-123"]
-
-    @respx.mock
-    async def test_delete_multiple(self) -> None:
-        route = respx.post(f"{BASE}/synthetics/tests/delete").respond(
-            json={
-                "deleted_tests": [
-                    {"public_id": "abc-123"},
-                    {"public_id": "def-456"},
-                ]
-            }
-        )
-        result = await delete_test(
-            SyntheticsDeleteTestInput(public_ids=["abc-123", "def-456"])
-        )
-        assert "deleted successfully" in result
-        assert "2" in result
-        body = json.loads(route.calls[0].request.content)
-        assert len(body["public_ids"]) == 2
+_DELETE_CASES = [
+    pytest.param(
+        ["abc-123"],
+        200,
+        {"deleted_tests": [{"public_id": "abc-123", "deleted_at": "2024-01-01T00:00:00Z"}]},
+        "deleted successfully",
+        id="single",
+    ),
+    pytest.param(
+        ["abc-123", "def-456"],
+        200,
+        {"deleted_tests": [{"public_id": "abc-123"}, {"public_id": "def-456"}]},
+        "2 synthetic tests deleted successfully",
+        id="multiple",
+    ),
+    pytest.param(["bad-id"], 404, None, "not found", id="not_found"),
+    pytest.param(["abc-123"], 403, None, "Error", id="api_error"),
+]
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.post(f"{BASE}/synthetics/tests/delete").respond(status_code=404)
-        result = await delete_test(SyntheticsDeleteTestInput(public_ids=["bad-id"]))
-        assert "not found" in result.lower()
 
-    @respx.mock
-    async def test_api_error(self) -> None:
-        respx.post(f"{BASE}/synthetics/tests/delete").respond(status_code=403)
-        result = await delete_test(SyntheticsDeleteTestInput(public_ids=["abc-123"]))
-        assert "Error" in result
+class TestDeleteTest:
+    @pytest.mark.parametrize("public_ids, status, payload, expected", _DELETE_CASES)
+    async def test_delete(
+        self,
+        mock_api: respx.MockRouter,
+        public_ids: list[str],
+        status: int,
+        payload: Optional[dict],
+        expected: str,
+    ) -> None:
+        route = mock_api.post(DELETE_URL).respond(status_code=status, json=payload)
+        result = await delete_test(SyntheticsDeleteTestInput(public_ids=public_ids))
+        assert expected.lower() in result.lower()
+        body = json.loads(route.calls[0].request.content)
+        assert body["public_ids"] == public_ids
@@ -4,7 +4,7 @@ import json
 
 import respx
 
-from pup_mcp.models.common import PaginatedInput, ResponseFormat
+from pup_mcp.models.common import PaginatedInput
 from pup_mcp.tools.tags import (
     TagsDeleteInput,
     TagsGetInput,
@@ -17,32 +17,31 @@ from pup_mcp.tools.tags import (
 )
 
 BASE = "https://api.datadoghq.com/api/v1"
+TAGS_URL = f"{BASE}/tags/hosts"
+HOST_TAGS_URL = f"{BASE}/tags/hosts/myhost"
 
 
 class TestListTags:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE}/tags/hosts").respond(json={"tags": {"env:prod": ["host1"]}})
-        result = await list_tags(PaginatedInput())
+    async def test_returns_json(
+        self, mock_api: respx.MockRouter, default_page: PaginatedInput
+    ) -> None:
+        mock_api.get(TAGS_URL).respond(json={"tags": {"env:prod": ["host1"]}})
+        result = await list_tags(default_page)
         data = json.loads(result)
         assert "tags" in data
 
 
 class TestGetTags:
-    @respx.mock
-    async def test_returns_tags(self) -> None:
-        respx.get(f"{BASE}/tags/hosts/myhost").respond(json={"tags": ["env:prod", "role:web"]})
+    async def test_returns_tags(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(HOST_TAGS_URL).respond(json={"tags": ["env:prod", "role:web"]})
         result = await get_tags(TagsGetInput(host="myhost"))
         data = json.loads(result)
         assert "env:prod" in data["tags"]
 
 
 class TestAddTags:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.post(f"{BASE}/tags/hosts/myhost").respond(
-            json={"host": "myhost", "tags": ["env:prod"]}
-        )
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.post(HOST_TAGS_URL).respond(json={"host": "myhost", "tags": ["env:prod"]})
         result = await add_tags(TagsModifyInput(host="myhost", tags=["env:prod"]))
         data = json.loads(result)
         assert data["tags"] == ["env:prod"]
@@ -51,9 +50,8 @@ class TestAddTags:
 
 
 class TestUpdateTags:
-    @respx.mock
-    async def test_success(self) -> None:
-        route = respx.put(f"{BASE}/tags/hosts/myhost").respond(
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        route = mock_api.put(HOST_TAGS_URL).respond(
             json={"host": "myhost", "tags": ["env:staging"]}
         )
         result = await update_tags(TagsModifyInput(host="myhost", tags=["env:staging"]))
@@ -62,14 +60,12 @@ class TestUpdateTags:
 
 
 class TestDeleteTags:
-    @respx.mock
-    async def test_success(self) -> None:
-        respx.delete(f"{BASE}/tags/hosts/myhost").respond(status_code=204)
+    async def test_success(self, mock_api: respx.MockRouter) -> None:
+        mock_api.delete(HOST_TAGS_URL).respond(status_code=204)
         result = await delete_tags(TagsDeleteInput(host="myhost"))
         assert "deleted" in result.lower()
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.delete(f"{BASE}/tags/hosts/nope").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.delete(f"{BASE}/tags/hosts/nope").respond(status_code=404)
         result = await delete_tags(TagsDeleteInput(host="nope"))
         assert "not found" in result.lower()
@@ -1,83 +1,84 @@
 """Tests for pup_mcp.utils.time_parser."""
 
 import time
-from unittest.mock import patch
 
 import pytest
 
 from pup_mcp.exceptions import TimeParseError
-from pup_mcp.utils.time_parser import now_unix, parse_time
+from pup_mcp.utils.time_parser import _parse_absolute, now_unix, parse_time
 
 
 class TestParseTimeRelative:
     """Test relative time format parsing."""
 
-    @patch("pup_mcp.utils.time_parser.time.time", return_value=1700000000.0)
-    def test_hours(self, mock_time: object) -> None:
-        result = parse_time("1h")
-        assert result == 1700000000 - 3600
-
-    @patch("pup_mcp.utils.time_parser.time.time", return_value=1700000000.0)
-    def test_minutes(self, mock_time: object) -> None:
-        result = parse_time("30m")
-        assert result == 1700000000 - 30 * 60
-
-    @patch("pup_mcp.utils.time_parser.time.time", return_value=1700000000.0)
-    def test_days(self, mock_time: object) -> None:
-        result = parse_time("7d")
-        assert result == 1700000000 - 7 * 86400
-
-    @patch("pup_mcp.utils.time_parser.time.time", return_value=1700000000.0)
-    def test_weeks(self, mock_time: object) -> None:
-        result = parse_time("2w")
-        assert result == 1700000000 - 2 * 604800
-
-    @patch("pup_mcp.utils.time_parser.time.time", return_value=1700000000.0)
-    def test_seconds(self, mock_time: object) -> None:
-        result = parse_time("120s")
-        assert result == 1700000000 - 120
+    @pytest.mark.parametrize(
+        "value, delta",
+        [
+            ("1h", 3600),
+            ("30m", 30 * 60),
+            ("7d", 7 * 86400),
+            ("2w", 2 * 604800),
+            ("120s", 120),
+        ],
+    )
+    def test_relative(self, frozen_now: int, value: str, delta: int) -> None:
+        assert parse_time(value) == frozen_now - delta
 
 
 class TestParseTimeAbsolute:
     """Test absolute time format parsing."""
 
-    def test_unix_timestamp(self) -> None:
-        assert parse_time("1700000000") == 1700000000
-
-    def test_long_unix_timestamp(self) -> None:
-        assert parse_time("17000000000") == 17000000000
-
-    def test_iso8601_utc(self) -> None:
-        result = parse_time("2024-01-15T10:30:00Z")
-        assert isinstance(result, int)
-        assert result > 0
-
-    def test_iso8601_offset(self) -> None:
-        result = parse_time("2024-01-15T10:30:00+00:00")
-        assert isinstance(result, int)
-        assert result > 0
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            pytest.param("1700000000", 1700000000, id="unix"),
+            pytest.param("17000000000", 17000000000, id="long_unix"),
+            pytest.param("2024-01-15T10:30:00Z", 1705314600, id="iso8601_utc"),
+            pytest.param("2024-01-15T10:30:00+00:00", 1705314600, id="iso8601_offset"),
+            pytest.param("2024-02-29T23:59:59Z", 1709251199, id="iso8601_utc_leap_day"),
+        ],
+    )
+    def test_absolute(self, value: str, expected: int) -> None:
+        assert parse_time(value) == expected
+
+    def test_absolute_results_are_cached(self) -> None:
+        _parse_absolute.cache_clear()
+        first = parse_time("2024-01-15T10:30:00Z")
+        second = parse_time("2024-01-15T10:30:00Z")
+        assert first == second
+        assert _parse_absolute.cache_info().hits == 1
+
+    def test_relative_bypasses_cache(self, frozen_now: int) -> None:
+        _parse_absolute.cache_clear()
+        parse_time("1h")
+        assert _parse_absolute.cache_info().currsize == 0
 
 
 class TestParseTimeInvalid:
     """Test error handling for invalid inputs."""
 
-    def test_garbage_string(self) -> None:
-        with pytest.raises(TimeParseError, match="Invalid time"):
-            parse_time("not-a-time")
-
-    def test_empty_string(self) -> None:
-        with pytest.raises(TimeParseError, match="Invalid time"):
-            parse_time("")
-
-    def test_partial_relative(self) -> None:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("not-a-time", id="garbage"),
+            pytest.param("", id="empty"),
+            pytest.param("1x", id="partial_relative"),
+            pytest.param("2023-02-29T00:00:00Z", id="iso8601_out_of_range"),
+            pytest.param("2024-01-15T10:30:00Z\n", id="iso8601_trailing_newline"),
+            pytest.param("２０２４-01-15T10:30:00Z", id="iso8601_non_ascii_digits"),
+        ],
+    )
+    def test_invalid(self, value: str) -> None:
         with pytest.raises(TimeParseError, match="Invalid time"):
-            parse_time("1x")
+            parse_time(value)
 
 
 class TestNowUnix:
     """Test now_unix helper."""
 
     def test_returns_int(self) -> None:
+        before = int(time.time())
         result = now_unix()
+        after = int(time.time())
         assert isinstance(result, int)
-        assert abs(result - int(time.time())) <= 1
+        assert before <= result <= after
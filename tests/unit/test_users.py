@@ -4,60 +4,70 @@ import json
 
 import respx
 
-from pup_mcp.models.common import PaginatedInput, ResponseFormat
+from pup_mcp.models.common import PaginatedInput
 from pup_mcp.tools.users import UserGetInput, get_user, list_roles, list_users
 
 BASE_V1 = "https://api.datadoghq.com/api/v1"
 BASE_V2 = "https://api.datadoghq.com/api/v2"
+USER_URL = f"{BASE_V1}/user"
+
+_USER_LIST: dict = {
+    "users": [
+        {"handle": "user@co.com", "name": "Test User", "email": "user@co.com", "role": "admin", "disabled": False},
+    ],
+}
 
 
 class TestListUsers:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE_V1}/user").respond(
-            json={"users": [{"handle": "user@co.com", "name": "Test User", "email": "user@co.com", "role": "admin", "disabled": False}]}
-        )
-        result = await list_users(PaginatedInput())
+    async def test_returns_json(
+        self, mock_api: respx.MockRouter, default_page: PaginatedInput
+    ) -> None:
+        mock_api.get(USER_URL).respond(json=_USER_LIST)
+        result = await list_users(default_page)
         data = json.loads(result)
         assert len(data["users"]) == 1
 
-    @respx.mock
-    async def test_markdown(self) -> None:
-        respx.get(f"{BASE_V1}/user").respond(
-            json={"users": [{"handle": "user@co.com", "name": "Test User", "email": "user@co.com", "role": "admin", "disabled": False}]}
-        )
-        result = await list_users(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
-        assert "# Users" in result
+    async def test_markdown(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(USER_URL).respond(json=_USER_LIST)
+        result = await list_users(markdown_page)
+        assert result.startswith("# Users (1)")
         assert "Test User" in result
 
-    @respx.mock
-    async def test_empty_markdown(self) -> None:
-        respx.get(f"{BASE_V1}/user").respond(json={"users": []})
-        result = await list_users(PaginatedInput(response_format=ResponseFormat.MARKDOWN))
-        assert "No users found" in result
+    async def test_empty_markdown(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(USER_URL).respond(json={"users": []})
+        result = await list_users(markdown_page)
+        assert result.startswith("No users found")
+
+    async def test_list_payload(
+        self, mock_api: respx.MockRouter, markdown_page: PaginatedInput
+    ) -> None:
+        mock_api.get(USER_URL).respond(json=[{"id": "x"}])
+        result = await list_users(markdown_page)
+        assert result == "No users found."
 
 
 class TestGetUser:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE_V1}/user/user123").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE_V1}/user/user123").respond(
             json={"user": {"handle": "user@co.com", "name": "Test"}}
         )
         result = await get_user(UserGetInput(user_id="user123"))
         data = json.loads(result)
         assert data["user"]["handle"] == "user@co.com"
 
-    @respx.mock
-    async def test_not_found(self) -> None:
-        respx.get(f"{BASE_V1}/user/bad").respond(status_code=404)
+    async def test_not_found(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE_V1}/user/bad").respond(status_code=404)
         result = await get_user(UserGetInput(user_id="bad"))
         assert "not found" in result.lower()
 
 
 class TestListRoles:
-    @respx.mock
-    async def test_returns_json(self) -> None:
-        respx.get(f"{BASE_V2}/roles").respond(
+    async def test_returns_json(self, mock_api: respx.MockRouter) -> None:
+        mock_api.get(f"{BASE_V2}/roles").respond(
             json={"data": [{"id": "role1", "attributes": {"name": "Admin"}}]}
         )
         result = await list_roles()